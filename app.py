@@ -37,6 +37,12 @@ def load_user(user_id: str):
         return s.get(User, int(user_id))
 
 
+@app.teardown_appcontext
+def remove_session(exc=None):
+    """Release the request's scoped session back to the pool"""
+    SessionLocal.remove()
+
+
 # ============================================================
 # GLOBAL TEMPLATE CONTEXT
 # ============================================================
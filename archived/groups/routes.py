@@ -4,13 +4,13 @@ from __future__ import annotations
 from flask import render_template, request, redirect, url_for, flash, abort
 from flask_login import login_required, current_user
 from sqlalchemy import select, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from db import SessionLocal
 from models import Group, GroupMembership, User, Poll, SpreadPoll
 from utils.group_helpers import (
     get_current_group, get_user_groups, switch_group as switch_group_helper,
-    is_member, is_owner, generate_invite_code,
+    is_member, get_membership_role, generate_invite_code,
     add_user_to_group, get_group_by_invite_code, search_public_groups
 )
 
@@ -29,7 +29,7 @@ def groups_dashboard():
     """Show all user's groups"""
     session = SessionLocal()
     try:
-        user_groups = get_user_groups(current_user.id, session)
+        user_groups = get_user_groups(current_user.id, session, load_members=True)
         current_group = get_current_group(current_user, session)
 
         return render_template(
@@ -58,8 +58,9 @@ def group_detail(group_id: int):
             return redirect(url_for("groups.groups_dashboard"))
 
         # Check if user is member (unless public group)
-        user_is_member = is_member(current_user.id, group_id, session)
-        user_is_owner = is_owner(current_user.id, group_id, session)
+        role = get_membership_role(current_user.id, group_id, session)
+        user_is_member = role is not None
+        user_is_owner = role == "owner"
 
         if not group.is_public and not user_is_member:
             flash("You don't have access to this private group.", "danger")
@@ -98,15 +99,15 @@ def search():
     session = SessionLocal()
     try:
         if query:
-            groups = search_public_groups(query, session)
+            groups = search_public_groups(query, session, load_members=True)
         else:
             # Show all public groups
             groups = session.execute(
                 select(Group)
                 .where(Group.is_public == True)
-                .options(joinedload(Group.members))
+                .options(selectinload(Group.members))
                 .order_by(Group.name)
-            ).unique().scalars().all()
+            ).scalars().all()
 
         # Mark which groups user is already in
         user_groups = get_user_groups(current_user.id, session)
@@ -196,7 +197,7 @@ def join_by_invite(invite_code: str):
     """Join group via invite link (public page, redirects to login if needed)"""
     session = SessionLocal()
     try:
-        group = get_group_by_invite_code(invite_code, session)
+        group = get_group_by_invite_code(invite_code, session, load_members=True)
 
         if not group:
             flash("Invalid invite code.", "danger")
@@ -26,7 +26,7 @@ from sqlalchemy.orm import Session
 
 from db import SessionLocal
 from models import Team, SpreadPoll, SpreadGame, BovadaTeamMapping, Group
-from utils.bovada_team_mapper import map_bovada_team
+from utils.bovada_team_mapper import prefetch_mapping_context, map_bovada_team_cached, flush_mapping_context
 from utils.scrape_bovada import fetch_events_for_sport, fetch_event_node_by_link, extract_key_markets
 
 SPORT = "football/college-football"
@@ -242,6 +242,12 @@ def run_ingestion():
 
         print(f"[✓] Filtered to {len(weekend_events)} weekend games (Friday & Saturday)\n")
 
+        # Load team mappings once for every team name in this run
+        mapping_ctx = prefetch_mapping_context(
+            list(weekend_events['home_team']) + list(weekend_events['away_team']),
+            session
+        )
+
         # Process spreads for each group
         for group in all_groups:
             print(f"\n{'='*60}")
@@ -273,8 +279,8 @@ def run_ingestion():
                     continue
 
                 # Map teams
-                home_team_result = map_bovada_team(home_team_name, session)
-                away_team_result = map_bovada_team(away_team_name, session)
+                home_team_result = map_bovada_team_cached(home_team_name, mapping_ctx, session)
+                away_team_result = map_bovada_team_cached(away_team_name, mapping_ctx, session)
 
                 if not home_team_result:
                     print(f"[!] Could not map home team: '{home_team_name}'")
@@ -348,6 +354,7 @@ def run_ingestion():
                 print(f"    Unmapped teams: {len(unmapped_teams)}")
 
         # Commit all changes for all groups
+        flush_mapping_context(mapping_ctx, session)
         session.commit()
 
         print(f"\n{'='*60}")
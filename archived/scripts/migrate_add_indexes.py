@@ -0,0 +1,107 @@
+"""
+Migration script to add composite indexes for hot query paths.
+
+This script creates (if missing):
+1. ix_spreadpick_poll_user on spread_picks (spread_poll_id, user_id)
+   - vote/results/dashboard look up a user's picks for a poll
+2. ix_spreadpick_user_correct on spread_picks (user_id, is_correct)
+   - stats counts correct/incorrect/pending picks per user
+3. ix_gm_user_group_role on group_memberships (user_id, group_id, role)
+   - is_member / is_owner / get_membership_role / get_user_groups;
+     covers the role column so PostgreSQL can answer index-only
+
+The models should declare the same indexes in __table_args__:
+    SpreadPick:
+        Index('ix_spreadpick_poll_user', 'spread_poll_id', 'user_id'),
+        Index('ix_spreadpick_user_correct', 'user_id', 'is_correct'),
+    GroupMembership:
+        Index('ix_gm_user_group_role', 'user_id', 'group_id', 'role'),
+
+On PostgreSQL indexes are built with CREATE INDEX CONCURRENTLY so the
+tables stay writable during the build.
+
+It's safe to run multiple times - existing indexes are skipped.
+"""
+
+from dotenv import load_dotenv, find_dotenv
+load_dotenv(find_dotenv())
+
+import sys
+from sqlalchemy import text, inspect
+from db import SessionLocal, engine
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_spreadpick_poll_user", "spread_picks", ("spread_poll_id", "user_id")),
+    ("ix_spreadpick_user_correct", "spread_picks", ("user_id", "is_correct")),
+    ("ix_gm_user_group_role", "group_memberships", ("user_id", "group_id", "role")),
+]
+
+
+def get_existing_indexes(table):
+    """Get index names on a table, or None if the table doesn't exist"""
+    inspector = inspect(engine)
+    if table not in inspector.get_table_names():
+        return None
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def run_migration():
+    """Create any missing indexes"""
+    session = SessionLocal()
+
+    try:
+        print("\n" + "="*60)
+        print("COMPOSITE INDEX MIGRATION")
+        print("="*60 + "\n")
+
+        dialect_name = engine.dialect.name
+        print(f"[*] Detected database: {dialect_name}")
+
+        for i, (name, table, columns) in enumerate(INDEXES, start=1):
+            print(f"\n[{i}/{len(INDEXES)}] {name} on {table} ({', '.join(columns)})...")
+
+            existing = get_existing_indexes(table)
+            if existing is None:
+                print(f"  [!] {table} table does not exist - skipping")
+                continue
+            if name in existing:
+                print("  ✓ Index already exists")
+                continue
+
+            if dialect_name == 'postgresql':
+                # CONCURRENTLY can't run inside a transaction block
+                with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    conn.execute(text(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+                    ))
+            else:
+                session.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+                ))
+                session.commit()
+            print(f"  ✓ Created index: {name}")
+
+        print("\n" + "="*60)
+        print("MIGRATION COMPLETE!")
+        print("="*60 + "\n")
+
+    except Exception as e:
+        session.rollback()
+        print(f"\n[ERROR] Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    print("\nThis migration will add composite indexes for the spreads and groups pages.")
+    print("It's safe to run multiple times - it checks before making changes.\n")
+
+    response = input("Continue with migration? (yes/no): ")
+    if response.lower() in ('yes', 'y'):
+        run_migration()
+    else:
+        print("Migration cancelled.")
@@ -57,32 +57,27 @@ TEAM_NAME_MAP = {
     "Pittsburgh": ["Pittsburgh", "Pitt"],
 }
 
-def find_team_id(session, team_name):
-    """Find team ID by name, trying variations"""
-    # Try exact match first
-    team = session.execute(
-        select(Team).where(Team.name == team_name)
-    ).scalar_one_or_none()
+def find_team_id(by_name, team_name):
+    """Find team ID by name, trying variations
 
-    if team:
-        return team.id
+    by_name maps lowercased team name -> team ID, so lookups stay in-process
+    """
+    # Try exact match first
+    team_id = by_name.get(team_name.lower())
+    if team_id:
+        return team_id
 
     # Try variations
-    variations = TEAM_NAME_MAP.get(team_name, [team_name])
-    for variant in variations:
-        team = session.execute(
-            select(Team).where(Team.name == variant)
-        ).scalar_one_or_none()
-        if team:
-            return team.id
+    for variant in TEAM_NAME_MAP.get(team_name, []):
+        team_id = by_name.get(variant.lower())
+        if team_id:
+            return team_id
 
     # Try case-insensitive partial match
-    team = session.execute(
-        select(Team).where(Team.name.ilike(f"%{team_name}%"))
-    ).scalars().first()
-
-    if team:
-        return team.id
+    needle = team_name.lower()
+    for name, team_id in by_name.items():
+        if needle in name:
+            return team_id
 
     return None
 
@@ -105,35 +100,37 @@ def run_update():
 
         # Step 2: Get all teams and build lookup
         print("\n[2/3] Loading teams from database...")
-        all_teams = session.execute(select(Team)).scalars().all()
-        print(f"  ✓ Found {len(all_teams)} teams in database")
+        rows = session.execute(select(Team.id, Team.name)).all()
+        print(f"  ✓ Found {len(rows)} teams in database")
+        by_name = {name.lower(): tid for tid, name in rows}
+        id_to_name = {tid: name for tid, name in rows}
 
         # Step 3: Insert new rankings
         print("\n[3/3] Inserting new CFP rankings...")
         inserted = 0
         not_found = []
+        ballot_rows = []
 
         for team_name, rank in NEW_RANKINGS:
-            team_id = find_team_id(session, team_name)
+            team_id = find_team_id(by_name, team_name)
 
             if not team_id:
                 not_found.append((rank, team_name))
                 print(f"  [!] Could not find team: {team_name} (rank {rank})")
                 continue
 
-            default_ballot = DefaultBallot(
-                poll_id=None,  # Global default
-                week_key=None,
-                rank=rank,
-                team_id=team_id
-            )
-            session.add(default_ballot)
+            ballot_rows.append({
+                'poll_id': None,  # Global default
+                'week_key': None,
+                'rank': rank,
+                'team_id': team_id,
+            })
             inserted += 1
 
-            # Get the actual team name from DB for confirmation
-            team = session.get(Team, team_id)
-            print(f"  ✓ Rank {rank:2d}: {team.name}")
+            # Print the actual team name from DB for confirmation
+            print(f"  ✓ Rank {rank:2d}: {id_to_name[team_id]}")
 
+        session.bulk_insert_mappings(DefaultBallot, ballot_rows)
         session.commit()
 
         print("\n" + "="*60)
@@ -1,14 +1,14 @@
 # spreads/routes.py
 from __future__ import annotations
 
-from flask import render_template, request, redirect, url_for, flash, abort, jsonify
+from flask import render_template, request, redirect, url_for, flash, abort, jsonify, current_app
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
 import pytz
 
 from flask_login import login_required, current_user
 from sqlalchemy import select, func, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload, raiseload
 from sqlalchemy.exc import IntegrityError
 
 from db import SessionLocal
@@ -29,39 +29,71 @@ def require_admin():
         abort(403)
 
 
-def game_is_locked(game_time):
-    """Check if game is locked (started or within 5 minutes of start)
-    Handles both timezone-aware and timezone-naive datetimes"""
-    if not game_time:
-        return False
-    # Get current time in UTC and convert to ET (naive, -5 hours for EST)
-    now_utc = datetime.now(timezone.utc)
-    now_et = now_utc - timedelta(hours=5)
-    now_et = now_et.replace(tzinfo=None)
+# ET is treated as a fixed UTC-5 offset throughout the spreads pages
+_ET_OFFSET = timedelta(hours=5)
+_LOCK_BUFFER = timedelta(minutes=5)
 
-    # Handle timezone-aware game_time from old data
-    if game_time.tzinfo is not None:
-        # Convert to naive ET time (subtract 5 hours from UTC)
-        game_time = game_time.astimezone(timezone.utc) - timedelta(hours=5)
-        game_time = game_time.replace(tzinfo=None)
 
-    # Lock picks 5 minutes before game starts
-    lock_time = game_time - timedelta(minutes=5)
-    return now_et >= lock_time
+def _to_naive_et(dt):
+    """Convert a datetime to naive ET; naive inputs are already ET and pass through"""
+    if dt.tzinfo is None:
+        return dt
+    # Shift to UTC via the fixed offset, then to ET, without a tz conversion
+    return (dt - dt.utcoffset() - _ET_OFFSET).replace(tzinfo=None)
 
 
-def is_valid_weekend_game(game_time):
-    """Check if game is scheduled for Nov 14 or 15, 2024"""
-    if not game_time:
-        return False
+def _now_et():
+    """Current time as naive ET (-5 hours from UTC for EST)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None) - _ET_OFFSET
+
+
+def _lock_cutoff_for(game_time):
+    """Naive ET time at which picks for a game lock (5 minutes before start)
+    Handles both timezone-aware and timezone-naive datetimes"""
+    return _to_naive_et(game_time) - _LOCK_BUFFER
 
-    # Handle timezone-aware datetimes
-    if game_time.tzinfo is not None:
-        game_time = game_time.astimezone(timezone.utc) - timedelta(hours=5)
-        game_time = game_time.replace(tzinfo=None)
 
-    # Check if it's November 14 or 15
-    return game_time.month == 11 and game_time.day in (14, 15)
+def game_is_locked(game_time, now_et=None):
+    """Check if game is locked (started or within 5 minutes of start)
+    Pass now_et when checking many games so the clock is read only once"""
+    if not game_time:
+        return False
+    if now_et is None:
+        now_et = _now_et()
+    return now_et >= _lock_cutoff_for(game_time)
+
+
+def _game_time_et_sql(dialect_name):
+    """SpreadGame.game_time as naive ET in SQL, mirroring _to_naive_et():
+    only a PostgreSQL timestamptz column comes back tz-aware and needs the shift;
+    naive columns (and SQLite, which stores no offset) are already ET"""
+    game_time = SpreadGame.game_time
+    if dialect_name == "postgresql" and getattr(game_time.type, "timezone", False):
+        return func.timezone('UTC', game_time) - _ET_OFFSET
+    return game_time
+
+
+def valid_weekend_game_filters(session):
+    """SQL predicates for games scheduled Nov 14 or 15 (ET, via _game_time_et_sql)
+    with real spreads, so only those are loaded from the database"""
+    dialect_name = session.get_bind().dialect.name
+    game_time_et = _game_time_et_sql(dialect_name)
+    if dialect_name == "sqlite":
+        month = func.strftime('%m', game_time_et)
+        day = func.strftime('%d', game_time_et)
+        date_filters = (month == '11', day.in_(('14', '15')))
+    else:
+        month = func.extract('month', game_time_et)
+        day = func.extract('day', game_time_et)
+        date_filters = (month == 11, day.in_((14, 15)))
+
+    return (
+        *date_filters,
+        SpreadGame.home_spread.isnot(None),
+        SpreadGame.home_spread.notin_(('', 'N/A')),
+        SpreadGame.away_spread.isnot(None),
+        SpreadGame.away_spread.notin_(('', 'N/A')),
+    )
 
 
 def get_latest_open_poll(session, group_id):
@@ -70,7 +102,8 @@ def get_latest_open_poll(session, group_id):
         select(SpreadPoll)
         .where(SpreadPoll.is_open == True, SpreadPoll.group_id == group_id)
         .order_by(SpreadPoll.season.desc(), SpreadPoll.week.desc())
-    ).scalar_one_or_none()
+        .limit(1)
+    ).scalars().first()
 
 
 def get_latest_poll(session, group_id):
@@ -79,7 +112,8 @@ def get_latest_poll(session, group_id):
         select(SpreadPoll)
         .where(SpreadPoll.group_id == group_id)
         .order_by(SpreadPoll.season.desc(), SpreadPoll.week.desc())
-    ).scalar_one_or_none()
+        .limit(1)
+    ).scalars().first()
 
 
 # -------------------------
@@ -98,44 +132,34 @@ def dashboard():
             flash("Please join a group first", "warning")
             return redirect(url_for("groups.search"))
 
-        # Filter polls by current group
+        # Filter polls by current group (read-only listing: plain rows, no ORM objects)
         polls = session.execute(
-            select(SpreadPoll)
+            select(SpreadPoll.id, SpreadPoll.season, SpreadPoll.week, SpreadPoll.title, SpreadPoll.is_open)
             .where(SpreadPoll.group_id == current_group.id)
             .order_by(SpreadPoll.season.desc(), SpreadPoll.week.desc())
-        ).scalars().all()
+        ).all()
 
-        # Get user's pick counts for each poll
+        # Get user's pick counts for each poll, using the same game filter as vote/results
+        weekend_filters = valid_weekend_game_filters(session)
         poll_data = []
         for poll in polls:
-            # Get all games and filter to Nov 14-15 with valid spreads
-            games = session.execute(
-                select(SpreadGame)
-                .where(SpreadGame.spread_poll_id == poll.id)
-            ).scalars().all()
-
-            # Apply same filtering as vote/results pages
-            filtered_games = [
-                game for game in games
-                if is_valid_weekend_game(game.game_time)
-                and game.home_spread and game.home_spread != 'N/A'
-                and game.away_spread and game.away_spread != 'N/A'
-            ]
-            game_count = len(filtered_games)
+            game_count = session.execute(
+                select(func.count(SpreadGame.id))
+                .where(SpreadGame.spread_poll_id == poll.id, *weekend_filters)
+            ).scalar()
 
             # Count user's picks (only for filtered games)
             user_pick_count = 0
-            if current_user.is_authenticated:
-                filtered_game_ids = [g.id for g in filtered_games]
-                if filtered_game_ids:
-                    user_pick_count = session.execute(
-                        select(func.count(SpreadPick.id))
-                        .where(
-                            SpreadPick.spread_poll_id == poll.id,
-                            SpreadPick.user_id == current_user.id,
-                            SpreadPick.spread_game_id.in_(filtered_game_ids)
-                        )
-                    ).scalar()
+            if current_user.is_authenticated and game_count:
+                user_pick_count = session.execute(
+                    select(func.count(SpreadPick.id))
+                    .join(SpreadGame, SpreadGame.id == SpreadPick.spread_game_id)
+                    .where(
+                        SpreadPick.spread_poll_id == poll.id,
+                        SpreadPick.user_id == current_user.id,
+                        *weekend_filters
+                    )
+                ).scalar()
 
             poll_data.append({
                 'poll': poll,
@@ -199,25 +223,24 @@ def vote(season: int, week: int):
             flash(f"No spread poll found for Season {season}, Week {week}.", "danger")
             return redirect(url_for("spreads.dashboard"))
 
-        # Load games with teams
+        # Load Nov 14-15 games with valid spreads, with teams
+        # (in debug, any other lazy load raises instead of silently issuing N+1 queries)
+        opts = [
+            joinedload(SpreadGame.home_team),
+            joinedload(SpreadGame.away_team)
+        ]
+        if current_app.debug:
+            opts.append(raiseload("*"))
         games = session.execute(
             select(SpreadGame)
-            .options(
-                joinedload(SpreadGame.home_team),
-                joinedload(SpreadGame.away_team)
+            .options(*opts)
+            .where(
+                SpreadGame.spread_poll_id == poll.id,
+                *valid_weekend_game_filters(session)
             )
-            .where(SpreadGame.spread_poll_id == poll.id)
             .order_by(SpreadGame.game_time.asc())
         ).unique().scalars().all()
 
-        # Filter to only Nov 14-15 games with valid spreads
-        games = [
-            game for game in games
-            if is_valid_weekend_game(game.game_time)
-            and game.home_spread and game.home_spread != 'N/A'
-            and game.away_spread and game.away_spread != 'N/A'
-        ]
-
         # Load user's existing picks
         user_picks = {}
         if current_user.is_authenticated:
@@ -287,37 +310,37 @@ def submit_vote():
             .where(SpreadGame.spread_poll_id == poll_id)
         ).scalars().all()
 
-        # Process picks
+        # Load user's existing picks once, keyed by game
+        existing_picks = {
+            pick.spread_game_id: pick
+            for pick in session.execute(
+                select(SpreadPick)
+                .where(
+                    SpreadPick.spread_poll_id == poll_id,
+                    SpreadPick.user_id == current_user.id
+                )
+            ).scalars()
+        }
+
+        # Process picks - collect row mappings, then write them in bulk
         picks_saved = 0
         skipped_locked = 0
+        now = datetime.now(timezone.utc)
+        now_et = now.replace(tzinfo=None) - _ET_OFFSET
+        updates = []
+        inserts = []
         for game in games:
             # Skip games that have started or are about to start (5 min buffer)
-            if game_is_locked(game.game_time):
+            if game.game_time and _lock_cutoff_for(game.game_time) <= now_et:
                 skipped_locked += 1
                 continue
 
             # Form field: pick_game_{game.id} = team_id
             picked_team_id = request.form.get(f"pick_game_{game.id}", type=int)
+            existing = existing_picks.get(game.id)
 
             if not picked_team_id:
                 # User didn't pick this game - delete any existing pick
-                session.execute(
-                    select(SpreadPick)
-                    .where(
-                        SpreadPick.spread_poll_id == poll_id,
-                        SpreadPick.spread_game_id == game.id,
-                        SpreadPick.user_id == current_user.id
-                    )
-                ).scalar_one_or_none()
-                # If exists, delete it
-                existing = session.execute(
-                    select(SpreadPick)
-                    .where(
-                        SpreadPick.spread_poll_id == poll_id,
-                        SpreadPick.spread_game_id == game.id,
-                        SpreadPick.user_id == current_user.id
-                    )
-                ).scalar_one_or_none()
                 if existing:
                     session.delete(existing)
                 continue
@@ -333,34 +356,32 @@ def submit_vote():
             else:
                 spread_value = game.away_spread
 
-            # Check if pick already exists
-            existing = session.execute(
-                select(SpreadPick)
-                .where(
-                    SpreadPick.spread_poll_id == poll_id,
-                    SpreadPick.spread_game_id == game.id,
-                    SpreadPick.user_id == current_user.id
-                )
-            ).scalar_one_or_none()
-
             if existing:
                 # Update existing pick
-                existing.picked_team_id = picked_team_id
-                existing.spread_value = spread_value
-                existing.picked_at = datetime.now(timezone.utc)
+                updates.append({
+                    'id': existing.id,
+                    'picked_team_id': picked_team_id,
+                    'spread_value': spread_value,
+                    'picked_at': now,
+                })
             else:
                 # Create new pick
-                pick = SpreadPick(
-                    spread_poll_id=poll_id,
-                    spread_game_id=game.id,
-                    user_id=current_user.id,
-                    picked_team_id=picked_team_id,
-                    spread_value=spread_value
-                )
-                session.add(pick)
+                inserts.append({
+                    'spread_poll_id': poll_id,
+                    'spread_game_id': game.id,
+                    'user_id': current_user.id,
+                    'picked_team_id': picked_team_id,
+                    'spread_value': spread_value,
+                    'picked_at': now,
+                })
 
             picks_saved += 1
 
+        if updates:
+            session.bulk_update_mappings(SpreadPick, updates)
+        if inserts:
+            session.bulk_insert_mappings(SpreadPick, inserts)
+
         session.commit()
 
         # Show message about locked games if any
@@ -405,31 +426,35 @@ def results(season: int, week: int):
             flash(f"No spread poll found for Season {season}, Week {week}.", "danger")
             return redirect(url_for("spreads.dashboard"))
 
-        # Load games with picks
+        # Load Nov 14-15 games with valid spreads, with picks
+        # (in debug, any other lazy load raises instead of silently issuing N+1 queries)
+        opts = [
+            joinedload(SpreadGame.home_team),
+            joinedload(SpreadGame.away_team),
+            selectinload(SpreadGame.picks).joinedload(SpreadPick.user)
+        ]
+        if current_app.debug:
+            opts.append(raiseload("*"))
         games = session.execute(
             select(SpreadGame)
-            .options(
-                joinedload(SpreadGame.home_team),
-                joinedload(SpreadGame.away_team),
-                joinedload(SpreadGame.picks).joinedload(SpreadPick.user)
+            .options(*opts)
+            .where(
+                SpreadGame.spread_poll_id == poll.id,
+                *valid_weekend_game_filters(session)
             )
-            .where(SpreadGame.spread_poll_id == poll.id)
             .order_by(SpreadGame.game_time.asc())
         ).unique().scalars().all()
 
-        # Filter to only Nov 14-15 games with valid spreads
-        games = [
-            game for game in games
-            if is_valid_weekend_game(game.game_time)
-            and game.home_spread and game.home_spread != 'N/A'
-            and game.away_spread and game.away_spread != 'N/A'
-        ]
-
-        # Calculate user records
+        # Group games by day, calculate user records and collect pick users in a single pass
+        games_by_day = defaultdict(list)
         user_records = defaultdict(lambda: {'correct': 0, 'incorrect': 0, 'pending': 0})
 
+        user_map = {}
+
         for game in games:
+            games_by_day[game.game_day or "Saturday"].append(game)
             for pick in game.picks:
+                user_map[pick.user_id] = pick.user
                 if pick.is_correct is None:
                     user_records[pick.user_id]['pending'] += 1
                 elif pick.is_correct:
@@ -437,10 +462,6 @@ def results(season: int, week: int):
                 else:
                     user_records[pick.user_id]['incorrect'] += 1
 
-        # Get users
-        users = session.execute(select(User)).scalars().all()
-        user_map = {u.id: u for u in users}
-
         # Build leaderboard
         leaderboard = []
         for user_id, record in user_records.items():
@@ -460,12 +481,6 @@ def results(season: int, week: int):
         # Sort by correct picks, then by percentage
         leaderboard.sort(key=lambda x: (x['correct'], x['pct']), reverse=True)
 
-        # Group games by day
-        games_by_day = defaultdict(list)
-        for game in games:
-            day = game.game_day or "Saturday"
-            games_by_day[day].append(game)
-
         return render_template(
             "spreads_results.html",
             poll=poll,
@@ -584,12 +599,15 @@ def admin_panel():
             flash("Please join a group first", "warning")
             return redirect(url_for("groups.search"))
 
-        # Filter polls by current group
+        # Filter polls by current group (read-only listing: plain rows, no ORM objects)
         polls = session.execute(
-            select(SpreadPoll)
+            select(
+                SpreadPoll.id, SpreadPoll.season, SpreadPoll.week,
+                SpreadPoll.title, SpreadPoll.is_open, SpreadPoll.created_at
+            )
             .where(SpreadPoll.group_id == current_group.id)
             .order_by(SpreadPoll.season.desc(), SpreadPoll.week.desc())
-        ).scalars().all()
+        ).all()
 
         # Get game counts for each poll
         poll_data = []
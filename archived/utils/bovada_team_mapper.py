@@ -3,7 +3,14 @@ Utility to map Bovada team names to our Team database records.
 Uses fuzzy matching and manual mapping table for edge cases.
 """
 
-from typing import Optional, Tuple
+import re
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models import Team, BovadaTeamMapping
@@ -57,6 +64,41 @@ MANUAL_MAPPINGS = {
 }
 
 
+# Mascot names that Bovada might include after the school name
+MASCOTS = [
+    " Crimson Tide", " Tigers", " Bulldogs", " Wildcats", " Gators",
+    " Seminoles", " Buckeyes", " Wolverines", " Sooners", " Longhorns",
+    " Trojans", " Fighting Irish", " Ducks", " Huskies", " Cougars",
+    " Bears", " Cardinals", " Eagles", " Falcons", " Cowboys",
+    " Aggies", " Rebels", " Golden Bears", " Sun Devils", " Tar Heels",
+    " Blue Devils", " Yellow Jackets", " Hokies", " Hurricanes",
+    " Spartans", " Nittany Lions", " Cornhuskers", " Razorbacks",
+    " Volunteers", " Gamecocks", " Terrapins", " Scarlet Knights",
+    " Boilermakers", " Hawkeyes", " Golden Gophers", " Badgers",
+    " Mountaineers", " Red Raiders", " Horned Frogs", " Cyclones",
+    " Jayhawks", " Black Knights", " Midshipmen", " Rainbow Warriors",
+    " Broncos", " Rams", " Wolf Pack", " Lobos", " Roadrunners",
+    " Mean Green", " Bulls", " Knights", " Owls", " Pirates",
+    " Thundering Herd", " 49ers", " Bearcats", " Chanticleers",
+    " Ragin' Cajuns", " Ragin Cajuns", " Warhawks", " Flames",
+    " Minutemen", " Minutewomen", " Demon Deacons", " Orange",
+    " Commodores", " Cavaliers", " Hoosiers", " Illini",
+    " Chippewas", " Redhawks", " RedHawks", " Bobcats", " Rockets",
+    " Zips", " Cardinals", " Herd", " Hilltoppers", " Jaguars",
+    " Panthers", " Bearkats", " Monarchs", " Green Wave",
+    " Golden Hurricane", " Golden Eagles", " Mustangs", " Aztecs",
+    " Broncos", " Blazers", " Blue Raiders"
+]
+
+# Longest first so e.g. " Golden Bears" wins over " Bears"
+_MASCOT_RE = re.compile(
+    "(?:" + "|".join(re.escape(m) for m in sorted(set(MASCOTS), key=len, reverse=True)) + ")$"
+)
+# " St." / " St " -> " State"
+_STATE_RE = re.compile(r" St\.| St(?= )")
+
+
+@lru_cache(maxsize=8192)
 def normalize_team_name(name: str) -> str:
     """Normalize team name for better matching"""
     if not name:
@@ -66,39 +108,10 @@ def normalize_team_name(name: str) -> str:
     normalized = name.strip()
 
     # Remove mascot names that Bovada might include
-    mascots = [
-        " Crimson Tide", " Tigers", " Bulldogs", " Wildcats", " Gators",
-        " Seminoles", " Buckeyes", " Wolverines", " Sooners", " Longhorns",
-        " Trojans", " Fighting Irish", " Ducks", " Huskies", " Cougars",
-        " Bears", " Cardinals", " Eagles", " Falcons", " Cowboys",
-        " Aggies", " Rebels", " Golden Bears", " Sun Devils", " Tar Heels",
-        " Blue Devils", " Yellow Jackets", " Hokies", " Hurricanes",
-        " Spartans", " Nittany Lions", " Cornhuskers", " Razorbacks",
-        " Volunteers", " Gamecocks", " Terrapins", " Scarlet Knights",
-        " Boilermakers", " Hawkeyes", " Golden Gophers", " Badgers",
-        " Mountaineers", " Red Raiders", " Horned Frogs", " Cyclones",
-        " Jayhawks", " Black Knights", " Midshipmen", " Rainbow Warriors",
-        " Broncos", " Rams", " Wolf Pack", " Lobos", " Roadrunners",
-        " Mean Green", " Bulls", " Knights", " Owls", " Pirates",
-        " Thundering Herd", " 49ers", " Bearcats", " Chanticleers",
-        " Ragin' Cajuns", " Ragin Cajuns", " Warhawks", " Flames",
-        " Minutemen", " Minutewomen", " Demon Deacons", " Orange",
-        " Commodores", " Cavaliers", " Hoosiers", " Illini",
-        " Chippewas", " Redhawks", " RedHawks", " Bobcats", " Rockets",
-        " Zips", " Cardinals", " Herd", " Hilltoppers", " Jaguars",
-        " Panthers", " Bearkats", " Monarchs", " Green Wave",
-        " Golden Hurricane", " Golden Eagles", " Mustangs", " Aztecs",
-        " Broncos", " Blazers", " Blue Raiders"
-    ]
-
-    for mascot in mascots:
-        if normalized.endswith(mascot):
-            normalized = normalized[:-len(mascot)].strip()
-            break
+    normalized = _MASCOT_RE.sub("", normalized).strip()
 
     # Handle "State" variations
-    normalized = normalized.replace(" St.", " State")
-    normalized = normalized.replace(" St ", " State ")
+    normalized = _STATE_RE.sub(" State", normalized)
 
     # Remove extra whitespace
     normalized = " ".join(normalized.split())
@@ -106,35 +119,57 @@ def normalize_team_name(name: str) -> str:
     return normalized
 
 
-def fuzzy_match_score(s1: str, s2: str) -> float:
-    """
-    Simple fuzzy matching score between 0 and 1.
-    Uses basic edit distance approach.
-    """
-    s1, s2 = s1.lower(), s2.lower()
+class _TeamIndex(NamedTuple):
+    """Immutable snapshot of all teams for fuzzy matching - plain values, no ORM objects"""
+    entries: Tuple[Tuple[int, str, str], ...]  # (team id, name, normalized name)
+    names_norm: Mapping[int, str]  # team id -> normalized name, the choices handed to rapidfuzz
+    expires_at: float
+
 
-    # Exact match
-    if s1 == s2:
-        return 1.0
+# Rebuilt after the TTL or an explicit invalidate_team_index(); swapped whole under the lock,
+# so readers holding an older snapshot are never affected
+_TEAM_INDEX_TTL = 300.0
+_team_index: Optional[_TeamIndex] = None
+_team_index_lock = threading.Lock()
 
-    # Check if one contains the other
-    if s1 in s2 or s2 in s1:
-        return 0.9
 
-    # Calculate Levenshtein-like distance
-    len1, len2 = len(s1), len(s2)
-    if len1 == 0 or len2 == 0:
-        return 0.0
+def invalidate_team_index() -> None:
+    """Drop the cached team index (e.g. after teams are added or renamed)"""
+    global _team_index
+    with _team_index_lock:
+        _team_index = None
 
-    # Use simple character overlap approach for speed
-    set1, set2 = set(s1), set(s2)
-    overlap = len(set1 & set2)
-    total = len(set1 | set2)
 
-    if total == 0:
-        return 0.0
+def _get_team_index(session: Session) -> _TeamIndex:
+    """Current team index snapshot, loading it with the given session if missing or expired"""
+    global _team_index
+    with _team_index_lock:
+        index = _team_index
+        if index is None or index.expires_at <= time.monotonic():
+            entries = tuple(
+                (team_id, name, normalize_team_name(name))
+                for team_id, name in session.execute(select(Team.id, Team.name))
+            )
+            index = _TeamIndex(
+                entries=entries,
+                names_norm=MappingProxyType({team_id: norm for team_id, _, norm in entries}),
+                expires_at=time.monotonic() + _TEAM_INDEX_TTL,
+            )
+            _team_index = index
+        return index
 
-    return overlap / total
+
+def _best_fuzzy_team(normalized_name: str, session: Session, confidence_threshold: float) -> Optional[Team]:
+    """Best fuzzy Team match for an already-normalized name, or None below the threshold"""
+    best = process.extractOne(
+        normalized_name,
+        _get_team_index(session).names_norm,
+        scorer=fuzz.token_set_ratio,
+        processor=default_process,
+        score_cutoff=confidence_threshold * 100,
+    )
+    # best[2] is the team id key; load the Team in the caller's session
+    return session.get(Team, best[2]) if best else None
 
 
 def map_bovada_team(bovada_name: str, session: Session, confidence_threshold: float = 0.75) -> Optional[Tuple[Team, str]]:
@@ -192,21 +227,10 @@ def map_bovada_team(bovada_name: str, session: Session, confidence_threshold: fl
     # Try normalized match
     normalized_bovada = normalize_team_name(bovada_name)
 
-    # Get all teams and find best fuzzy match
-    all_teams = session.execute(select(Team)).scalars().all()
-
-    best_match = None
-    best_score = 0.0
-
-    for team in all_teams:
-        normalized_our = normalize_team_name(team.name)
-        score = fuzzy_match_score(normalized_bovada, normalized_our)
-
-        if score > best_score:
-            best_score = score
-            best_match = team
+    # Find best fuzzy match against the cached, pre-normalized team names
+    best_match = _best_fuzzy_team(normalized_bovada, session, confidence_threshold)
 
-    if best_match and best_score >= confidence_threshold:
+    if best_match:
         # Cache this fuzzy mapping
         mapping = BovadaTeamMapping(
             bovada_name=bovada_name,
@@ -220,6 +244,98 @@ def map_bovada_team(bovada_name: str, session: Session, confidence_threshold: fl
     return None
 
 
+class MappingContext:
+    """
+    Bovada mappings and teams loaded up front for a batch of lookups.
+    Build with prefetch_mapping_context() and resolve names with map_bovada_team_cached().
+    """
+
+    def __init__(self, by_bovada: Dict[str, Optional[Tuple[Team, str]]], by_name: Dict[str, Team], by_id: Dict[int, Team]):
+        self.by_bovada = by_bovada  # bovada_name -> (Team, confidence), or None if the mapped team is gone
+        self.by_name = by_name  # Team.name -> Team
+        self.by_id = by_id  # Team.id -> Team
+        self.pending: List[BovadaTeamMapping] = []  # new mappings not yet added to the session
+
+
+def prefetch_mapping_context(bovada_names: Iterable[str], session: Session) -> MappingContext:
+    """
+    Load existing Bovada mappings for the given names and all teams - two queries total.
+    """
+    names = {name for name in bovada_names if isinstance(name, str) and name}
+
+    # Teams are loaded into this session, not taken from the shared fuzzy-match index
+    by_id = {team.id: team for team in session.execute(select(Team)).scalars()}
+    by_name = {team.name: team for team in by_id.values()}
+
+    by_bovada = {}
+    if names:
+        mappings = session.execute(
+            select(BovadaTeamMapping)
+            .where(BovadaTeamMapping.bovada_name.in_(names))
+        ).scalars().all()
+        for mapping in mappings:
+            # An existing mapping is authoritative - never re-match or queue a duplicate for it;
+            # by_id holds every team, so a miss means the mapped team row is gone
+            team = by_id.get(mapping.team_id)
+            by_bovada[mapping.bovada_name] = (team, mapping.confidence) if team else None
+
+    return MappingContext(by_bovada, by_name, by_id)
+
+
+def map_bovada_team_cached(
+    bovada_name: str,
+    ctx: MappingContext,
+    session: Session,
+    confidence_threshold: float = 0.75
+) -> Optional[Tuple[Team, str]]:
+    """
+    Same as map_bovada_team(), but resolves against a prefetched MappingContext.
+    New mappings are queued on ctx.pending; write them with flush_mapping_context().
+    """
+    if not bovada_name:
+        return None
+
+    # Already mapped (in the database or earlier in this batch)
+    if bovada_name in ctx.by_bovada:
+        return ctx.by_bovada[bovada_name]
+
+    team = None
+    confidence = None
+
+    # Check manual mappings, then exact match, then fuzzy match
+    if bovada_name in MANUAL_MAPPINGS:
+        team = ctx.by_name.get(MANUAL_MAPPINGS[bovada_name])
+        confidence = 'manual'
+
+    if not team:
+        team = ctx.by_name.get(bovada_name)
+        confidence = 'exact'
+
+    if not team:
+        team = _best_fuzzy_team(normalize_team_name(bovada_name), session, confidence_threshold)
+        confidence = 'fuzzy'
+
+    if not team:
+        # No good match found
+        return None
+
+    ctx.pending.append(BovadaTeamMapping(
+        bovada_name=bovada_name,
+        team_id=team.id,
+        confidence=confidence
+    ))
+    ctx.by_bovada[bovada_name] = (team, confidence)
+    return (team, confidence)
+
+
+def flush_mapping_context(ctx: MappingContext, session: Session) -> None:
+    """Add all queued mappings to the session in one batch and flush"""
+    if ctx.pending:
+        session.add_all(ctx.pending)
+        session.flush()
+        ctx.pending = []
+
+
 def get_or_create_mapping(bovada_name: str, our_team_name: str, session: Session) -> BovadaTeamMapping:
     """
     Manually create/update a mapping between Bovada name and our team.
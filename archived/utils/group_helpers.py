@@ -2,10 +2,11 @@
 Helper functions for group management
 """
 
-from flask import session as flask_session
-from sqlalchemy.orm import Session, joinedload
+from flask import g, session as flask_session
+from sqlalchemy.orm import Session, selectinload
 from models import Group, GroupMembership, User
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from typing import Optional
 import secrets
 
 
@@ -17,37 +18,55 @@ def get_current_group_id():
 def set_current_group_id(group_id):
     """Set the current active group ID in session"""
     flask_session['current_group_id'] = group_id
+    # Drop the per-request get_current_group memo
+    g.pop('current_group', None)
 
 
-def get_current_group(user, db_session: Session):
+def get_current_group(user, db_session: Session, load_members: bool = False):
     """
     Get user's current active group from session.
     Falls back to first group if not set or invalid.
+    Pass load_members=True to eager-load Group.members for rendering.
+    Memoized on flask.g for the rest of the request.
     """
+    key = (user.id, load_members)
+    cache = g.get('current_group')
+    if cache is not None and key in cache:
+        return cache[key]
+    group = _load_current_group(user, db_session, load_members)
+    # Look the memo dict up only now: the fallback in _load_current_group calls
+    # set_current_group_id, which drops g.current_group, so an earlier reference could be stale
+    g.setdefault('current_group', {})[key] = group
+    return group
+
+
+def _load_current_group(user, db_session: Session, load_members: bool):
+    """Uncached body of get_current_group"""
     group_id = get_current_group_id()
 
     if group_id:
         # Verify user is member of this group
-        group = db_session.execute(
-            select(Group)
-            .where(Group.id == group_id)
-            .options(joinedload(Group.members))
-        ).unique().scalar_one_or_none()
+        query = select(Group).where(Group.id == group_id)
+        if load_members:
+            query = query.options(selectinload(Group.members))
+        group = db_session.execute(query).scalar_one_or_none()
 
         if group and is_member(user.id, group_id, db_session):
             return group
 
     # Fallback to user's first group (usually CLAAMP)
     # Query through the session instead of accessing user.groups (which may be detached)
-    membership = db_session.execute(
-        select(GroupMembership)
+    query = (
+        select(Group)
+        .join(GroupMembership, GroupMembership.group_id == Group.id)
         .where(GroupMembership.user_id == user.id)
-        .options(joinedload(GroupMembership.group).joinedload(Group.members))
         .limit(1)
-    ).unique().scalar_one_or_none()
+    )
+    if load_members:
+        query = query.options(selectinload(Group.members))
+    group = db_session.execute(query).scalar_one_or_none()
 
-    if membership:
-        group = membership.group
+    if group:
         set_current_group_id(group.id)  # Update session
         return group
 
@@ -67,26 +86,33 @@ def switch_group(user_id: int, group_id: int, db_session: Session) -> bool:
 
 def is_member(user_id: int, group_id: int, db_session: Session) -> bool:
     """Check if user is a member of a group"""
-    membership = db_session.execute(
-        select(GroupMembership)
-        .where(
+    return db_session.execute(
+        select(exists().where(
             GroupMembership.user_id == user_id,
             GroupMembership.group_id == group_id
-        )
-    ).scalar_one_or_none()
-    return membership is not None
+        ))
+    ).scalar()
 
 
 def is_owner(user_id: int, group_id: int, db_session: Session) -> bool:
     """Check if user is the owner of a group"""
-    membership = db_session.execute(
-        select(GroupMembership)
+    return get_membership_role(user_id, group_id, db_session) == "owner"
+
+
+def get_membership_role(user_id: int, group_id: int, db_session: Session) -> Optional[str]:
+    """
+    Get user's role in a group ("owner", "member", ...), or None if not a member.
+    Use when both membership and ownership are needed - one query instead of two.
+    Served index-only by ix_gm_user_group_role (user_id, group_id, role).
+    """
+    return db_session.execute(
+        select(GroupMembership.role)
         .where(
             GroupMembership.user_id == user_id,
             GroupMembership.group_id == group_id
         )
+        .limit(1)
     ).scalar_one_or_none()
-    return membership and membership.role == "owner"
 
 
 def generate_invite_code() -> str:
@@ -111,32 +137,34 @@ def add_user_to_group(user_id: int, group_id: int, db_session: Session, role: st
     return True
 
 
-def get_user_groups(user_id: int, db_session: Session):
+def get_user_groups(user_id: int, db_session: Session, load_members: bool = False):
     """Get all groups a user is a member of"""
-    memberships = db_session.execute(
-        select(GroupMembership)
+    query = (
+        select(Group)
+        .join(GroupMembership, GroupMembership.group_id == Group.id)
         .where(GroupMembership.user_id == user_id)
-        .options(joinedload(GroupMembership.group).joinedload(Group.members))
-    ).unique().scalars().all()
-
-    return [membership.group for membership in memberships]
+    )
+    if load_members:
+        query = query.options(selectinload(Group.members))
+    return db_session.execute(query).scalars().all()
 
 
-def get_group_by_invite_code(invite_code: str, db_session: Session):
+def get_group_by_invite_code(invite_code: str, db_session: Session, load_members: bool = False):
     """Find a group by its invite code"""
-    return db_session.execute(
-        select(Group)
-        .where(Group.invite_code == invite_code)
-        .options(joinedload(Group.members))
-    ).unique().scalar_one_or_none()
+    query = select(Group).where(Group.invite_code == invite_code)
+    if load_members:
+        query = query.options(selectinload(Group.members))
+    return db_session.execute(query).scalar_one_or_none()
 
 
-def search_public_groups(query: str, db_session: Session):
+def search_public_groups(query: str, db_session: Session, load_members: bool = False):
     """Search for public groups by name"""
-    return db_session.execute(
+    stmt = (
         select(Group)
         .where(Group.is_public == True)
         .where(Group.name.ilike(f"%{query}%"))
-        .options(joinedload(Group.members))
         .order_by(Group.name)
-    ).unique().scalars().all()
+    )
+    if load_members:
+        stmt = stmt.options(selectinload(Group.members))
+    return db_session.execute(stmt).scalars().all()
@@ -3,13 +3,25 @@
 
 from __future__ import annotations
 
-import json, time, random, re
-from typing import Any, Dict, List, Optional
+import csv, json, time, random, re, threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    _json_loads = json.loads
+
 __all__ = [
     "fetch_events_for_sport",
     "fetch_event_node_by_link",
@@ -26,18 +38,70 @@ COUPON_BASE   = "https://www.bovada.lv/services/sports/event/coupon/events/A/des
 COUPON_PARAMS = "?marketFilterId=def&preMatchOnly=false&eventsLimit=5000&lang=en"  # include live + prematch; you can filter later
 DETAIL_BASE   = "https://www.bovada.lv/services/sports/event/coupon/events/A/description"
 SCORES_BASE   = "https://services.bovada.lv/services/sports/results/api/v2/scores/"
+_BOVADA_HOSTS = ("https://www.bovada.lv/", "https://services.bovada.lv/")
 
 REQ_TIMEOUT   = 12
 RETRIES       = 3
-SLEEP_BETWEEN = 0.25   # mild throttle between dependent requests
+SLEEP_BETWEEN = 0.25   # mild throttle: at most one request start per SLEEP_BETWEEN seconds (~4 req/s module-wide)
+MAX_WORKERS   = 4      # per-event fetch threads; ~1/SLEEP_BETWEEN keeps the limiter busy, more would only queue on it
 
 DEBUG = False  # flip to True if you want payload previews
 
+# Orchestrator output columns, in order (also the CSV header)
+_COLS = (
+    "scraped_at_utc", "sport", "event_id", "description", "link",
+    "start_time_utc", "status", "last_modified_utc", "home_team", "away_team", "is_live",
+    "home_ml", "away_ml", "ml_status", "ml_source",
+    "home_spread", "home_spread_price", "away_spread", "away_spread_price",
+    "spread_status", "spread_source",
+    "total_line", "over_price", "under_price", "total_status", "total_source",
+    "home_score", "away_score", "clock", "period", "score_status",
+)
+
+_PRICE_COLS = ["home_ml", "away_ml", "home_spread_price", "away_spread_price", "over_price", "under_price"]
+_DTYPES = {
+    "home_score": "Int64", "away_score": "Int64",
+    "home_spread": "float64", "away_spread": "float64", "total_line": "float64",
+    "is_live": "bool",
+}
+
 # =========================
 # Full-game filtering helpers
 # =========================
 
-WANTED_KEYS = {"2W-12", "3W-12", "2W-HCAP", "HCAP", "2W-OU", "OU"}
+WANTED_KEYS = frozenset({"2W-12", "3W-12", "2W-HCAP", "HCAP", "2W-OU", "OU"})
+
+# Market keys / outcome tokens used by extract_key_markets
+_ML2_KEYS   = frozenset({"2W-12"})
+_ML3_KEYS   = frozenset({"3W-12"})
+_HCAP_KEYS  = frozenset({"2W-HCAP", "HCAP"})
+_OU_KEYS    = frozenset({"2W-OU", "OU"})
+_DRAW_TYPES = frozenset({"D", "DRAW"})
+_DRAW_DESCS = frozenset({"draw", "tie"})
+_HOME_TYPES = frozenset({"H", "HOME", "1", "TEAM 1"})
+_AWAY_TYPES = frozenset({"A", "AWAY", "2", "TEAM 2"})
+
+# Candidate ranking inputs (lower is better; anything else ranks last)
+_PERIOD_RANK = {"Live Game": 0, "Game": 1}
+_STATUS_RANK = {"O": 0, "o": 0, "S": 1, "s": 1}
+_IS_MAIN_DYN = re.compile(r"main dynamic", re.I).match  # case-insensitive prefix test, no lower() copy
+
+# Candidate buckets in extract_key_markets
+_ML2, _ML3, _SP, _TOT = range(4)
+_BUCKET_OF = {
+    "2W-12": _ML2, "3W-12": _ML3,
+    "2W-HCAP": _SP, "HCAP": _SP,
+    "2W-OU": _TOT, "OU": _TOT,
+}
+# Lowest possible rank per bucket (only spreads can earn the symmetry bit)
+_BEST_RANKS = (1, 1, 0, 1)
+
+def _saturated(best: List[Optional[tuple]]) -> bool:
+    """True once 2-way ML, spread and total all hold a top-ranked candidate (3-way ML is only a fallback)."""
+    for b in (_ML2, _SP, _TOT):
+        if best[b] is None or best[b][0] != _BEST_RANKS[b]:
+            return False
+    return True
 
 # Substrings that flag non–full-game markets
 _BAD_PERIOD_TOKENS = (
@@ -51,93 +115,136 @@ _BAD_MARKET_DESC_TOKENS = (
     "exact score", "correct score",
 )
 
-def _is_full_game_period(period: dict | None) -> bool:
+# Precompiled alternations: one regex scan instead of a Python loop per token
+_BAD_PERIOD_RE  = re.compile("|".join(map(re.escape, _BAD_PERIOD_TOKENS)))
+_BAD_MARKET_RE  = re.compile("|".join(map(re.escape, _BAD_MARKET_DESC_TOKENS)))
+_GOOD_MARKET_RE = re.compile(r"moneyline|point spread|spread|total")
+
+def _is_full_game_period_lc(desc_lc: str, abbr_lc: str, num: Any, main: bool) -> bool:
     """
-    Heuristic gate:
+    Heuristic gate (inputs already stripped + lowercased by the caller):
       - Reject anything that looks like Half/Quarter by description/abbr/number.
       - Accept explicit 'Live Game'.
       - Accept 'Game' when period.main=True (Bovada sometimes uses this while live).
     """
-    if not isinstance(period, dict):
-        return False
-    desc = (period.get("description") or "").strip().lower()
-    abbr = (period.get("abbreviation") or "").strip().lower()
-    num  = period.get("number") or period.get("periodNumber")
-
-    hay = f"{desc} {abbr}".strip().lower()
-    if any(tok in hay for tok in _BAD_PERIOD_TOKENS):
+    if _BAD_PERIOD_RE.search(f"{desc_lc} {abbr_lc}"):
         return False
     if isinstance(num, int) and num in (1, 2, 3, 4):
         return False
 
-    if "live" in desc and "game" in desc:
+    if "live" in desc_lc and "game" in desc_lc:
         return True
-    if desc == "game" and bool(period.get("main", False)):
+    if desc_lc == "game" and main:
         return True
-    if abbr in {"lg"}:
+    if abbr_lc == "lg":
         return True
 
     return False
 
-def _allowed_market_desc(desc: str | None) -> bool:
-    d = (desc or "").strip().lower()
-    if any(tok in d for tok in _BAD_MARKET_DESC_TOKENS):
-        return False
-    return any(tok in d for tok in ("moneyline", "point spread", "spread", "total"))
+def _allowed_market_desc_lc(desc_lc: str) -> bool:
+    return bool(_GOOD_MARKET_RE.search(desc_lc)) and not _BAD_MARKET_RE.search(desc_lc)
+
+_MINUS_TRANS = str.maketrans({"−": "-"})  # U+2212 → ASCII hyphen-minus
 
 def _norm_minus(s: Optional[str]) -> Optional[str]:
-    return None if s is None else s.replace("−", "-")
+    return None if s is None else s.translate(_MINUS_TRANS)
+
+# Plain decimal / integer strings; validated up front instead of try/except
+_NUM_RE = re.compile(r"\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?\s*")
+_INT_RE = re.compile(r"\s*[-+]?\d+\s*")
+
+# datetime.fromtimestamp's range in epoch ms: 0001-01-01 .. 10000-01-01 (exclusive)
+_MIN_TS_MS = -62135596800000.0
+_MAX_TS_MS = 253402300800000.0
 
 def _to_num(val: Optional[str]) -> Optional[float]:
-    if val is None: return None
-    try:
+    if isinstance(val, (int, float)):
         return float(val)
-    except Exception:
-        return None
+    if isinstance(val, str) and _NUM_RE.fullmatch(val):
+        return float(val)
+    return None
 
 def _to_int(val: Optional[str]) -> Optional[int]:
-    if val is None: return None
-    try:
-        return int(str(val).strip())
-    except Exception:
-        return None
+    if isinstance(val, int):
+        return None if isinstance(val, bool) else val
+    if isinstance(val, str) and _INT_RE.fullmatch(val):
+        return int(val)
+    return None
 
-def _safe_dt_ms(ms: Optional[int]) -> Optional[datetime]:
-    if ms is None:
-        return None
-    try:
-        return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
-    except Exception:
-        return None
+def _ms_to_datetimes(values: List[Any]) -> pd.DatetimeIndex:
+    """
+    Epoch-ms column -> datetime64[us, UTC], like datetime.fromtimestamp(ms / 1000)
+    per value (0 and negative ms included); non-numeric or out-of-range values become NaT.
+    """
+    arr = np.array([v if isinstance(v, (int, float)) else np.nan for v in values], dtype="float64")
+    ok = (arr >= _MIN_TS_MS) & (arr < _MAX_TS_MS)  # NaN fails both comparisons
+    us = np.full(arr.shape, np.datetime64("NaT"), dtype="datetime64[us]")
+    us[ok] = np.round(arr[ok] * 1000).astype("int64")
+    return pd.DatetimeIndex(us).tz_localize("UTC")
 
 # =========================
 # HTTP helpers
 # =========================
 
+_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
 def _ua() -> Dict[str, str]:
-    agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    ]
-    return {
-        "User-Agent": random.choice(agents),
+    # Accept/Connection live on the session; only the UA rotates per request
+    return {"User-Agent": random.choice(_AGENTS)}
+
+def _make_session() -> requests.Session:
+    """Pooled keep-alive session; urllib3 handles connection-level retries."""
+    sess = requests.Session()
+    sess.headers.update({
         "Accept": "application/json, text/plain, */*",
         "Connection": "keep-alive",
-    }
+    })
+    retry = Retry(total=RETRIES, backoff_factor=0.3)
+    sess.mount("https://", HTTPAdapter(max_retries=retry))
+    sess.mount("http://", HTTPAdapter(max_retries=retry))
+    # Bovada hosts keep one pooled socket per orchestrator worker (one pool per host),
+    # so no worker's connection is dropped and re-handshaked after a request
+    bovada = HTTPAdapter(pool_connections=len(_BOVADA_HOSTS), pool_maxsize=MAX_WORKERS, max_retries=retry)
+    for host in _BOVADA_HOSTS:
+        sess.mount(host, bovada)
+    return sess
+
+_SESSION = _make_session()
+
+class _RateLimiter:
+    """
+    Thread-safe request pacing shared by all workers: each caller reserves the
+    next free slot (spaced `interval` apart) and sleeps until it arrives.
+    """
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+_RATE_LIMITER = _RateLimiter(SLEEP_BETWEEN)
 
 def http_get(url: str) -> Optional[requests.Response]:
-    last_err = None
-    for i in range(RETRIES):
-        try:
-            resp = requests.get(url, headers=_ua(), timeout=REQ_TIMEOUT)
-            return resp
-        except requests.RequestException as e:
-            last_err = e
-            time.sleep(0.3 + 0.4 * i)
-    if DEBUG:
-        print(f"[WARN] GET failed after {RETRIES} tries: {url} :: {last_err}")
-    return None
+    _RATE_LIMITER.wait()
+    try:
+        return _SESSION.get(url, headers=_ua(), timeout=REQ_TIMEOUT)
+    except requests.RequestException as e:
+        if DEBUG:
+            print(f"[WARN] GET failed after {RETRIES} retries: {url} :: {e}")
+        return None
 
 def http_get_json(url: str) -> Optional[Any]:
     resp = http_get(url)
@@ -152,12 +259,59 @@ def http_get_json(url: str) -> Optional[Any]:
             print(f"[DEBUG] HTTP {resp.status_code} for {url}")
         return None
     try:
-        return resp.json()
-    except json.JSONDecodeError:
+        return _json_loads(resp.content)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
         if DEBUG:
             print(f"[DEBUG] JSON decode error for {url}; text[:200]={resp.text[:200]}")
         return None
 
+class _Uncached(Exception):
+    """Raised by a ttl_cache'd fetcher to return `value` without caching it (transient failure)."""
+    def __init__(self, value: Any):
+        super().__init__()
+        self.value = value
+
+_KWD_MARK = object()  # separates positional from keyword args in ttl_cache keys
+
+def ttl_cache(maxsize: int = 512, ttl: float = 5.0) -> Callable:
+    """
+    Thread-safe LRU + TTL memo for the per-event fetchers (keyed by the call
+    args, i.e. by URL). Every returned value is cached, including "not found"
+    answers; a fetcher raises _Uncached(value) for transport/decode failures so
+    those are returned as-is and retried next call.
+    Cached values are shared: callers must treat them as read-only.
+    """
+    def deco(fn: Callable) -> Callable:
+        cache: "OrderedDict[Any, tuple]" = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWD_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None:
+                    if hit[1] > now:
+                        cache.move_to_end(key)
+                        return hit[0]
+                    del cache[key]
+
+            try:
+                value = fn(*args, **kwargs)
+            except _Uncached as e:
+                return e.value
+            with lock:
+                cache[key] = (value, time.monotonic() + ttl)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return deco
+
 # =========================
 # Coupon (events) layer
 # =========================
@@ -178,7 +332,10 @@ def fetch_events_for_sport(sport_path: str, live_only: bool = True) -> pd.DataFr
     except Exception:
         sport_desc = None
 
-    rows = []
+    # Column-wise accumulation: one list per column, no per-event dict
+    event_ids, descriptions, links, statuses = [], [], [], []
+    start_times, last_modified = [], []
+    home_teams, away_teams, home_ids, away_ids, live_flags = [], [], [], [], []
     for ev in block[0].get("events", []):
         is_live = bool(ev.get("live", False))
         if live_only and not is_live:
@@ -188,35 +345,74 @@ def fetch_events_for_sport(sport_path: str, live_only: bool = True) -> pd.DataFr
         home = next((c for c in comps if c.get("home")), {})
         away = next((c for c in comps if not c.get("home")), {})
 
-        rows.append({
-            "sport": sport_desc,
-            "event_id": ev.get("id"),
-            "description": ev.get("description"),
-            "link": ev.get("link"),
-            "start_time_utc": _safe_dt_ms(ev.get("startTime")),
-            "status": ev.get("status"),
-            "last_modified_utc": _safe_dt_ms(ev.get("lastModified")),
-            "home_team": home.get("name"),
-            "away_team": away.get("name"),
-            "home_competitor_id": str(home.get("id") or home.get("competitorId") or ""),
-            "away_competitor_id": str(away.get("id") or away.get("competitorId") or ""),
-            "is_live": is_live,
-        })
-    return pd.DataFrame(rows)
+        event_ids.append(ev.get("id"))
+        descriptions.append(ev.get("description"))
+        links.append(ev.get("link"))
+        start_times.append(ev.get("startTime"))
+        statuses.append(ev.get("status"))
+        last_modified.append(ev.get("lastModified"))
+        home_teams.append(home.get("name"))
+        away_teams.append(away.get("name"))
+        home_ids.append(str(home.get("id") or home.get("competitorId") or ""))
+        away_ids.append(str(away.get("id") or away.get("competitorId") or ""))
+        live_flags.append(is_live)
+
+    if not event_ids:
+        return pd.DataFrame()
+
+    return pd.DataFrame({
+        "sport": [sport_desc] * len(event_ids),
+        "event_id": event_ids,
+        "description": descriptions,
+        "link": links,
+        "start_time_utc": _ms_to_datetimes(start_times),
+        "status": statuses,
+        "last_modified_utc": _ms_to_datetimes(last_modified),
+        "home_team": home_teams,
+        "away_team": away_teams,
+        "home_competitor_id": home_ids,
+        "away_competitor_id": away_ids,
+        "is_live": np.array(live_flags, dtype=bool),
+    })
 
 # =========================
 # Markets layer (per event)
 # =========================
 
 DETAIL_KEY_MAP = {
-    "moneyline": {"2W-12", "3W-12"},
-    "spread":    {"2W-HCAP", "HCAP"},
-    "total":     {"2W-OU", "OU"},
+    "moneyline": _ML2_KEYS | _ML3_KEYS,
+    "spread":    _HCAP_KEYS,
+    "total":     _OU_KEYS,
 }
 
+@lru_cache(maxsize=4096)
+def _detail_url(link_path: str) -> str:
+    return f"{DETAIL_BASE}{link_path}?lang=en"
+
+def _cacheable_get_json(url: str, not_found: Any) -> Any:
+    """
+    http_get_json for ttl_cache'd fetchers: a 404 returns `not_found` (a real,
+    cacheable answer); transport, HTTP and decode failures raise _Uncached(not_found).
+    """
+    resp = http_get(url)
+    if resp is None:
+        raise _Uncached(not_found)
+    if resp.status_code == 404:
+        return not_found
+    if not (200 <= resp.status_code < 300):
+        if DEBUG:
+            print(f"[DEBUG] HTTP {resp.status_code} for {url}")
+        raise _Uncached(not_found)
+    try:
+        return _json_loads(resp.content)
+    except json.JSONDecodeError:
+        if DEBUG:
+            print(f"[DEBUG] JSON decode error for {url}; text[:200]={resp.text[:200]}")
+        raise _Uncached(not_found)
+
+@ttl_cache(maxsize=512, ttl=15.0)
 def fetch_event_node_by_link(link_path: str) -> Optional[Dict[str, Any]]:
-    url = f"{DETAIL_BASE}{link_path}?lang=en"
-    js = http_get_json(url)
+    js = _cacheable_get_json(_detail_url(link_path), None)
     if not js:
         return None
     try:
@@ -224,6 +420,20 @@ def fetch_event_node_by_link(link_path: str) -> Optional[Dict[str, Any]]:
     except Exception:
         return None
 
+# One outcome with every field extract_key_markets looks at, normalized once
+_Norm = namedtuple("_Norm", "price desc_l type_u pid american handicap")
+
+def _normalize(oc: Dict[str, Any]) -> _Norm:
+    price = oc.get("price") or {}
+    return _Norm(
+        price=price,
+        desc_l=(oc.get("description") or "").strip().lower(),
+        type_u=(oc.get("type") or "").strip().upper(),
+        pid=str(oc.get("participantId") or oc.get("competitorId") or price.get("participantId") or ""),
+        american=_norm_minus(price.get("american")),
+        handicap=_to_num(price.get("handicap")),
+    )
+
 def extract_key_markets(ev_node, home_id, away_id, home_name, away_name):
     """
     ML/Spread/Total @ FULL GAME only, with per-market fallback:
@@ -239,138 +449,125 @@ def extract_key_markets(ev_node, home_id, away_id, home_name, away_name):
     if not ev_node:
         return out
 
-    # collect candidates
-    cands = []
+    # keep only the best (lowest-rank) candidate per market type as we go:
+    # best[bucket] = (rank, market, period desc); first seen wins ties
+    best: List[Optional[tuple]] = [None] * len(_BEST_RANKS)
     for dg in (ev_node.get("displayGroups") or []):
-        dg_default = bool(dg.get("defaultType"))
+        dg_rank = 0 if dg.get("defaultType") else 1
         for m in (dg.get("markets") or []):
-            key = m.get("key")
-            if key not in WANTED_KEYS:
+            bucket = _BUCKET_OF.get(m.get("key"))
+            if bucket is None:
                 continue
             period = m.get("period") or {}
-            if not _is_full_game_period(period):
+            if not isinstance(period, dict):
+                continue
+            # strip/lower each field once and reuse for all the gates below
+            pdesc = (period.get("description") or "").strip()
+            period_desc_lc = pdesc.lower()
+            period_abbr_lc = (period.get("abbreviation") or "").strip().lower()
+            if not _is_full_game_period_lc(
+                period_desc_lc,
+                period_abbr_lc,
+                period.get("number") or period.get("periodNumber"),
+                bool(period.get("main", False)),
+            ):
                 continue
-            if not _allowed_market_desc(m.get("description")):
+            market_desc_lc = (m.get("description") or "").strip().lower()
+            if not _allowed_market_desc_lc(market_desc_lc):
                 continue
 
-            pdesc = (period.get("description") or "").strip()
-            dkey  = (m.get("descriptionKey") or "")
-            is_main_dynamic = dkey.lower().startswith("main dynamic")
-            status = (m.get("status") or "").upper()
+            # per-market rank inputs, each derived once; status is nearly always
+            # exactly 'O'/'S' so look the raw value up instead of upper()-ing it
+            period_rank = _PERIOD_RANK.get(pdesc, 9)
+            status_rank = _STATUS_RANK.get(m.get("status"), 2)
+            main_dyn    = 0 if _IS_MAIN_DYN(m.get("descriptionKey") or "") else 1
 
             # spread symmetry preference
             sym_spread = None
-            if key in {"2W-HCAP","HCAP"}:
-                try:
-                    hs = []
-                    for oc in (m.get("outcomes") or []):
-                        h = (oc.get("price") or {}).get("handicap")
-                        if h is not None:
-                            hs.append(float(str(h)))
-                    if len(hs) >= 2 and any(abs(a) == abs(b) and a*b < 0 for a in hs for b in hs if a != b):
-                        sym_spread = True
-                except Exception:
-                    sym_spread = None
-
-            cands.append({
-                "key": key,
-                "market": m,
-                "_period": pdesc,                 # "Live Game" or "Game"
-                "_status": status,                # 'O' or 'S'
-                "_dg_default": dg_default,
-                "_is_main_dynamic": is_main_dynamic,
-                "_sym_spread": sym_spread,
-            })
-
-    def choose(key_set: set[str]):
-        pool = [x for x in cands if x["key"] in key_set]
-        if not pool:
+            if bucket == _SP:
+                # symmetric = some +h line has its -h twin; one pass over a set
+                vals = set()
+                for oc in (m.get("outcomes") or []):
+                    h = _to_num((oc.get("price") or {}).get("handicap"))
+                    if h is not None:
+                        vals.add(h)
+                sym_spread = any(v > 0 and -v in vals for v in vals) or None
+
+            # rank asc (lower is better), packed into one int:
+            # period | status | main dynamic | default display group | symmetric spread
+            sym_rank = 0 if sym_spread else 1
+            rank = (period_rank << 8) | (status_rank << 6) | (main_dyn << 4) | (dg_rank << 2) | sym_rank
+            cur = best[bucket]
+            if cur is None or rank < cur[0]:
+                best[bucket] = (rank, m, pdesc)
+                if _saturated(best):
+                    break
+        else:
+            continue
+        break  # every market type already has an unbeatable candidate
+
+    def choose(slot: Optional[tuple]):
+        if slot is None:
             return None, None
-        # rank asc (lower is better)
-        def r(x):
-            period_rank = 0 if x["_period"] == "Live Game" else (1 if x["_period"] == "Game" else 9)
-            status_rank = 0 if x["_status"] == "O" else (1 if x["_status"] == "S" else 2)
-            main_dyn    = 0 if x["_is_main_dynamic"] else 1
-            dg_rank     = 0 if x["_dg_default"] else 1
-            sym_rank    = 0 if (x["key"] in {"2W-HCAP","HCAP"} and x["_sym_spread"]) else 1
-            return (period_rank, status_rank, main_dyn, dg_rank, sym_rank)
-        best = sorted(pool, key=r)[0]
-        src = "live" if best["_period"] == "Live Game" else "prematch"
-        return best["market"], src
+        _, market, pdesc = slot
+        return market, ("live" if pdesc == "Live Game" else "prematch")
 
     # pick markets (2-way first; ML can fall back to 3-way)
-    ml_mkt,   ml_src = choose({"2W-12"})
+    ml_mkt,   ml_src = choose(best[_ML2])
     if not ml_mkt:
-        ml_mkt, ml_src = choose({"3W-12"})
-    sp_mkt, sp_src   = choose({"2W-HCAP","HCAP"})
-    tot_mkt, tot_src = choose({"2W-OU","OU"})
-
-    def is_home_outcome(oc):
-        price = oc.get("price") or {}
-        pid   = str(oc.get("participantId") or oc.get("competitorId") or price.get("participantId") or "")
-        if home_id and pid and pid == home_id:
+        ml_mkt, ml_src = choose(best[_ML3])
+    sp_mkt, sp_src   = choose(best[_SP])
+    tot_mkt, tot_src = choose(best[_TOT])
+
+    # lowercase the team names once, not once per outcome
+    home_lower = home_name.lower() if isinstance(home_name, str) and home_name else None
+    away_lower = away_name.lower() if isinstance(away_name, str) and away_name else None
+
+    def is_home_outcome(n: _Norm):
+        # participantId settles it on the common path; text checks only after it fails
+        if home_id and n.pid == home_id:
             return True
-        desc = (oc.get("description") or "").strip().lower()
-        if home_name and home_name.lower() in desc: return True
-        if away_name and away_name.lower() in desc: return False
-        t = (oc.get("type") or "").strip().upper()
-        if t in {"H","HOME","1","TEAM 1"}: return True
-        if t in {"A","AWAY","2","TEAM 2"}: return False
+        if home_lower and home_lower in n.desc_l: return True
+        if away_lower and away_lower in n.desc_l: return False
+        if n.type_u in _HOME_TYPES: return True
+        if n.type_u in _AWAY_TYPES: return False
         return None
 
     # MONEYLINE
     if ml_mkt:
         out["ml_status"] = ml_mkt.get("status")
         out["ml_source"] = ml_src
-        for oc in (ml_mkt.get("outcomes") or []):
-            t = (oc.get("type") or "").strip().upper()
-            d = (oc.get("description") or "").strip().lower()
-            if t in {"D","DRAW"} or d in {"draw","tie"}:
+        for n in [_normalize(oc) for oc in (ml_mkt.get("outcomes") or [])]:
+            if n.type_u in _DRAW_TYPES or n.desc_l in _DRAW_DESCS:
                 continue
-            am = _norm_minus((oc.get("price") or {}).get("american"))
-            flag = is_home_outcome(oc)
+            flag = is_home_outcome(n)
             if flag is True and out["home_ml"] is None:
-                out["home_ml"] = am
+                out["home_ml"] = n.american
             elif flag is False and out["away_ml"] is None:
-                out["away_ml"] = am
+                out["away_ml"] = n.american
 
     # SPREAD
     if sp_mkt:
         out["spread_status"] = sp_mkt.get("status")
         out["spread_source"] = sp_src
-        for oc in (sp_mkt.get("outcomes") or []):
-            price = oc.get("price") or {}
-            am = _norm_minus(price.get("american"))
-            hcap = price.get("handicap")
-            try:
-                hcap = float(str(hcap)) if hcap is not None else None
-            except Exception:
-                hcap = None
-            flag = is_home_outcome(oc)
+        for n in [_normalize(oc) for oc in (sp_mkt.get("outcomes") or [])]:
+            flag = is_home_outcome(n)
             if flag is True:
-                out["home_spread"] = hcap; out["home_spread_price"] = am
+                out["home_spread"] = n.handicap; out["home_spread_price"] = n.american
             elif flag is False:
-                out["away_spread"] = hcap; out["away_spread_price"] = am
+                out["away_spread"] = n.handicap; out["away_spread_price"] = n.american
 
     # TOTAL
     if tot_mkt:
         out["total_status"] = tot_mkt.get("status")
         out["total_source"] = tot_src
-        for oc in (tot_mkt.get("outcomes") or []):
-            price = oc.get("price") or {}
-            am = _norm_minus(price.get("american"))
-            hcap = price.get("handicap")
-            try:
-                hcap = float(str(hcap)) if hcap is not None else None
-            except Exception:
-                hcap = None
-            desc = (oc.get("description") or "").strip().lower()
-            if desc == "over":
-                if out["total_line"] is None and hcap is not None: out["total_line"] = hcap
-                out["over_price"] = am
-            elif desc == "under":
-                if out["total_line"] is None and hcap is not None: out["total_line"] = hcap
-                out["under_price"] = am
+        for n in [_normalize(oc) for oc in (tot_mkt.get("outcomes") or [])]:
+            if n.desc_l == "over":
+                if out["total_line"] is None and n.handicap is not None: out["total_line"] = n.handicap
+                out["over_price"] = n.american
+            elif n.desc_l == "under":
+                if out["total_line"] is None and n.handicap is not None: out["total_line"] = n.handicap
+                out["under_price"] = n.american
 
     return out
 
@@ -378,22 +575,17 @@ def extract_key_markets(ev_node, home_id, away_id, home_name, away_name):
 # Scores layer (per event) with BGS support
 # =========================
 
+@ttl_cache(maxsize=512, ttl=2.0)
 def fetch_scores(event_id: str) -> Dict[str, Any]:
     """
     Supports:
       1) dict payloads with 'home'/'away' or 'homeTeam'/'awayTeam' + 'clock'/'eventClock'
       2) BGS list payloads with 'latestScore' and 'clock' (period/gameTime), 'gameStatus'
+    Always returns the score dict; fields are None when there is nothing to report.
     """
-    url = f"{SCORES_BASE}{event_id}"
-    resp = http_get(url)
     out = {"home_score": None, "away_score": None, "clock": None, "period": None, "score_status": None}
-
-    if resp is None or resp.status_code == 404 or not (200 <= resp.status_code < 300):
-        return out
-
-    try:
-        js = resp.json()
-    except json.JSONDecodeError:
+    js = _cacheable_get_json(f"{SCORES_BASE}{event_id}", out)
+    if js is out:  # 404: no scores yet
         return out
 
     # BGS style: list with dict containing latestScore + clock + gameStatus
@@ -434,88 +626,134 @@ def fetch_scores(event_id: str) -> Dict[str, Any]:
 # Orchestrator (optional, handy for testing)
 # =========================
 
+def _once_per_key(fn: Callable[[str], Any]) -> Callable[[str], Any]:
+    """
+    Thread-safe memo for one orchestrator run: the first caller for a key runs
+    fn, concurrent/later callers for the same key wait on and share its result.
+    """
+    futures: Dict[str, Future] = {}
+    lock = threading.Lock()
+
+    def get(key: str) -> Any:
+        with lock:
+            fut = futures.get(key)
+            owner = fut is None
+            if owner:
+                fut = futures[key] = Future()
+        if owner:
+            try:
+                fut.set_result(fn(key))
+            except Exception as e:
+                fut.set_exception(e)
+        return fut.result()
+
+    return get
+
 def fetch_bovada_live_games_with_markets(
     sport_types: Optional[List[str]] = None,
     include_prematch: bool = True,
-) -> pd.DataFrame:
+    to_csv: Optional[str] = None,
+) -> Optional[pd.DataFrame]:
     """
     Convenience function: returns a DataFrame with events + markets + (live-only) scores.
     Use your ingest to write to DB instead; this is mainly for local debugging/CSV.
+    With to_csv=path, rows are streamed to that CSV as they complete and None is returned.
     """
     sport_types = sport_types or ["football/college-football"]
     scraped_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    all_rows: List[Dict[str, Any]] = []
 
+    # Per-invocation dedupe: an event listed under several sport paths is fetched once
+    detail_once = _once_per_key(fetch_event_node_by_link)
+    scores_once = _once_per_key(fetch_scores)
+
+    def _fetch_one(r: Dict[str, Any]) -> Dict[str, Any]:
+        """Detail node + (live-only) scores for one event → output row."""
+        link = r.get("link")
+        ev_node = detail_once(link) if isinstance(link, str) else None
+
+        mk = extract_key_markets(
+            ev_node=ev_node,
+            home_id=str(r.get("home_competitor_id") or ""),
+            away_id=str(r.get("away_competitor_id") or ""),
+            home_name=r.get("home_team"),
+            away_name=r.get("away_team"),
+        ) if ev_node else {}
+
+        # scores only for live
+        sc = {"home_score": None, "away_score": None, "clock": None, "period": None, "score_status": None}
+        if bool(r.get("is_live")):
+            sc = scores_once(str(r["event_id"]))
+
+        return {
+            "scraped_at_utc": scraped_at,
+            "sport": r.get("sport"),
+            "event_id": r.get("event_id"),
+            "description": r.get("description"),
+            "link": r.get("link"),
+            "start_time_utc": r.get("start_time_utc"),
+            "status": r.get("status"),
+            "last_modified_utc": r.get("last_modified_utc"),
+            "home_team": r.get("home_team"),
+            "away_team": r.get("away_team"),
+            "is_live": bool(r.get("is_live")),
+            # Markets
+            "home_ml": mk.get("home_ml"),
+            "away_ml": mk.get("away_ml"),
+            "ml_status": mk.get("ml_status"),
+            "ml_source": mk.get("ml_source"),
+            "home_spread": mk.get("home_spread"),
+            "home_spread_price": mk.get("home_spread_price"),
+            "away_spread": mk.get("away_spread"),
+            "away_spread_price": mk.get("away_spread_price"),
+            "spread_status": mk.get("spread_status"),
+            "spread_source": mk.get("spread_source"),
+            "total_line": mk.get("total_line"),
+            "over_price": mk.get("over_price"),
+            "under_price": mk.get("under_price"),
+            "total_status": mk.get("total_status"),
+            "total_source": mk.get("total_source"),
+            # Scores
+            "home_score": sc.get("home_score"),
+            "away_score": sc.get("away_score"),
+            "clock": sc.get("clock"),
+            "period": sc.get("period"),
+            "score_status": sc.get("score_status"),
+        }
+
+    events: List[Dict[str, Any]] = []
     for spath in sport_types:
         base_df = fetch_events_for_sport(spath, live_only=not include_prematch)
         if base_df.empty:
             continue
+        events.extend(base_df.to_dict("records"))
+
+    # Per-event HTTP is I/O bound, but _RATE_LIMITER caps starts at 1/SLEEP_BETWEEN per second:
+    # the workers only hide response latency behind that pace, they don't raise it
+    if to_csv is not None:
+        with open(to_csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=_COLS)
+            writer.writeheader()
+            if events:
+                with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(events))) as ex:
+                    for row in ex.map(_fetch_one, events):
+                        # blank out NaN/NaT the way DataFrame.to_csv does
+                        writer.writerow({k: (None if pd.isna(v) else v) for k, v in row.items()})
+        return None
+
+    # column-wise accumulation: pandas takes the dict-of-lists fast path
+    cols: Dict[str, List[Any]] = {name: [] for name in _COLS}
+    if events:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(events))) as ex:
+            for row in ex.map(_fetch_one, events):
+                for name in _COLS:
+                    cols[name].append(row[name])
+
+    df = pd.DataFrame(cols, columns=_COLS).astype(_DTYPES, errors="ignore")
+    if df.empty:
+        return df
 
-        for _, r in base_df.iterrows():
-            link = r.get("link")
-            ev_node = fetch_event_node_by_link(link) if isinstance(link, str) else None
-            time.sleep(SLEEP_BETWEEN)
-
-            mk = extract_key_markets(
-                ev_node=ev_node,
-                home_id=str(r.get("home_competitor_id") or ""),
-                away_id=str(r.get("away_competitor_id") or ""),
-                home_name=r.get("home_team"),
-                away_name=r.get("away_team"),
-            ) if ev_node else {}
-
-            # scores only for live
-            sc = {"home_score": None, "away_score": None, "clock": None, "period": None, "score_status": None}
-            if bool(r.get("is_live")):
-                sc = fetch_scores(str(r["event_id"]))
-                time.sleep(SLEEP_BETWEEN)
-
-            row = {
-                "scraped_at_utc": scraped_at,
-                "sport": r.get("sport"),
-                "event_id": r.get("event_id"),
-                "description": r.get("description"),
-                "link": r.get("link"),
-                "start_time_utc": r.get("start_time_utc"),
-                "status": r.get("status"),
-                "last_modified_utc": r.get("last_modified_utc"),
-                "home_team": r.get("home_team"),
-                "away_team": r.get("away_team"),
-                "is_live": bool(r.get("is_live")),
-                # Markets
-                "home_ml": mk.get("home_ml"),
-                "away_ml": mk.get("away_ml"),
-                "ml_status": mk.get("ml_status"),
-                "ml_source": mk.get("ml_source"),
-                "home_spread": mk.get("home_spread"),
-                "home_spread_price": mk.get("home_spread_price"),
-                "away_spread": mk.get("away_spread"),
-                "away_spread_price": mk.get("away_spread_price"),
-                "spread_status": mk.get("spread_status"),
-                "spread_source": mk.get("spread_source"),
-                "total_line": mk.get("total_line"),
-                "over_price": mk.get("over_price"),
-                "under_price": mk.get("under_price"),
-                "total_status": mk.get("total_status"),
-                "total_source": mk.get("total_source"),
-                # Scores
-                "home_score": sc.get("home_score"),
-                "away_score": sc.get("away_score"),
-                "clock": sc.get("clock"),
-                "period": sc.get("period"),
-                "score_status": sc.get("score_status"),
-            }
-            all_rows.append(row)
-
-    df = pd.DataFrame(all_rows).reset_index(drop=True)
-
-    # types
-    for c in ["home_score", "away_score"]:
-        if c in df.columns: df[c] = pd.to_numeric(df[c], errors="coerce").astype("Int64")
-    for c in ["home_spread", "away_spread", "total_line"]:
-        if c in df.columns: df[c] = pd.to_numeric(df[c], errors="coerce")
-    for c in ["home_ml", "away_ml", "home_spread_price", "away_spread_price", "over_price", "under_price"]:
-        if c in df.columns: df[c] = df[c].astype("string").str.replace("−", "-", regex=False)
+    # U+2212 minus cleanup as one block op over the prices
+    df[_PRICE_COLS] = df[_PRICE_COLS].astype("string").apply(lambda s: s.str.translate(_MINUS_TRANS))
 
     return df
 
@@ -7,7 +7,12 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///claamp_poll.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, future=True)
+# Size the connection pool for server databases (SQLite keeps its default pool)
+engine_kwargs = {}
+if not DATABASE_URL.startswith("sqlite"):
+    engine_kwargs.update(pool_size=10, max_overflow=5)
+
+engine = create_engine(DATABASE_URL, pool_pre_ping=True, future=True, **engine_kwargs)
 SessionLocal = scoped_session(
     sessionmaker(
         bind=engine,
@@ -1,40 +1,54 @@
 import os
 
+# logos_dir -> (dir mtime, mapping); one entry per directory, rescanned when the mtime changes
+_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+
 def build_logo_map(logos_dir="logos"):
     """
     Scan the logos directory and return a mapping:
         clean_team_name -> actual_filename
     """
-    mapping = {}
-
     if not os.path.isdir(logos_dir):
         raise ValueError(f"Directory not found: {logos_dir}")
 
-    for filename in os.listdir(logos_dir):
-        # Skip junk / non-image files
-        if filename.lower().startswith("."):
-            continue
+    mtime = os.stat(logos_dir).st_mtime
+    cached = _cache.get(logos_dir)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+
+    mapping = {}
+
+    with os.scandir(logos_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            lower = filename.lower()
+
+            # Skip junk / non-image files
+            if lower.startswith("."):
+                continue
 
-        if not filename.lower().endswith((".png", ".jpg", ".jpeg", ".webp", ".svg")):
-            continue
+            if not lower.endswith((".png", ".jpg", ".jpeg", ".webp", ".svg")):
+                continue
 
-        # Remove extension
-        name_no_ext = os.path.splitext(filename)[0]
+            # Remove extension
+            name_no_ext = filename.rsplit(".", 1)[0]
 
-        # Clean up weird symbols
-        clean = (
-            name_no_ext
-            .replace("_", " ")
-            .replace("-", " ")
-            .strip()
-        )
+            # Clean up weird symbols
+            clean = (
+                name_no_ext
+                .replace("_", " ")
+                .replace("-", " ")
+                .strip()
+            )
 
-        # Title case (optional)
-        clean = " ".join(w.capitalize() for w in clean.split())
+            # Title case (optional)
+            clean = " ".join(w.capitalize() for w in clean.split())
 
-        mapping[clean] = filename
+            mapping[clean] = filename
 
-    return mapping
+    _cache[logos_dir] = (mtime, mapping)
+    return dict(mapping)
 
 
 # RUN IT
@@ -2,10 +2,15 @@
 TakeFreePoints.com - Betting Utilities
 Kelly Criterion, odds conversion, and bet sizing functions
 """
-import math
+from functools import lru_cache
+from math import erf, sqrt
 from typing import Optional
 
+import numpy as np
 
+
+# American odds come from a small set of values (-110, +150, ...), so cache conversions
+@lru_cache(maxsize=4096)
 def american_to_decimal(american_odds: int) -> float:
     """
     Convert American odds to decimal odds
@@ -30,6 +35,7 @@ def decimal_to_implied_probability(decimal_odds: float) -> float:
     return 1 / decimal_odds
 
 
+@lru_cache(maxsize=4096)
 def american_to_implied_probability(american_odds: int) -> float:
     """
     Convert American odds directly to implied probability
@@ -66,27 +72,44 @@ def kelly_criterion(
         Fraction of bankroll to bet (0-1)
         Returns 0 if no edge or negative edge
     """
-    if win_probability <= 0 or win_probability >= 1:
-        return 0.0
+    # b = net odds, q = 1 - p; no edge (or invalid inputs) -> no bet
+    b = decimal_odds - 1.0
+    k = (b * win_probability - (1.0 - win_probability)) / b if b > 0 else 0.0
+
+    # Apply fractional Kelly (for risk management)
+    return max(k, 0.0) * fraction if 0.0 < win_probability < 1.0 else 0.0
 
-    if decimal_odds <= 1:
-        return 0.0
 
-    # Calculate net odds (b)
-    b = decimal_odds - 1
+# All sizing functions share calculate_bet_size's argument order so it can call them
+# directly; each uses (and validates) only its own args and ignores the _-prefixed ones.
+def _kelly_size(bankroll, win_probability, american_odds, kelly_fraction, _flat_amount, _percentage) -> float:
+    """Fractional Kelly stake in dollars; needs win_probability and american_odds"""
+    if win_probability is None or american_odds is None:
+        raise ValueError("Kelly strategy requires win_probability and american_odds")
+    decimal_odds = american_to_decimal(american_odds)
+    return bankroll * kelly_criterion(win_probability, decimal_odds, kelly_fraction)
 
-    # Probability of losing
-    q = 1 - win_probability
 
-    # Kelly formula
-    kelly_fraction = (b * win_probability - q) / b
+def _flat_size(bankroll, _win_probability, _american_odds, _kelly_fraction, flat_amount, _percentage) -> float:
+    """Fixed dollar stake regardless of bankroll"""
+    if flat_amount is None:
+        raise ValueError("Flat strategy requires flat_amount")
+    return flat_amount
 
-    # No edge? No bet
-    if kelly_fraction <= 0:
-        return 0.0
 
-    # Apply fractional Kelly (for risk management)
-    return kelly_fraction * fraction
+def _percentage_size(bankroll, _win_probability, _american_odds, _kelly_fraction, _flat_amount, percentage) -> float:
+    """Fixed fraction of the bankroll (0.02 = 2%)"""
+    if percentage is None:
+        raise ValueError("Percentage strategy requires percentage")
+    return bankroll * percentage
+
+
+# strategy_type -> sizing function
+_STRATEGIES = {
+    "kelly": _kelly_size,
+    "flat": _flat_size,
+    "percentage": _percentage_size,
+}
 
 
 def calculate_bet_size(
@@ -115,27 +138,12 @@ def calculate_bet_size(
     Returns:
         Bet size in dollars
     """
-    if strategy_type == "kelly":
-        if win_probability is None or american_odds is None:
-            raise ValueError("Kelly strategy requires win_probability and american_odds")
-
-        decimal_odds = american_to_decimal(american_odds)
-        kelly_frac = kelly_criterion(win_probability, decimal_odds, kelly_fraction)
-        bet_size = bankroll * kelly_frac
-
-    elif strategy_type == "flat":
-        if flat_amount is None:
-            raise ValueError("Flat strategy requires flat_amount")
-        bet_size = flat_amount
-
-    elif strategy_type == "percentage":
-        if percentage is None:
-            raise ValueError("Percentage strategy requires percentage")
-        bet_size = bankroll * percentage
-
-    else:
+    size_fn = _STRATEGIES.get(strategy_type)
+    if size_fn is None:
         raise ValueError(f"Unknown strategy type: {strategy_type}")
 
+    bet_size = size_fn(bankroll, win_probability, american_odds, kelly_fraction, flat_amount, percentage)
+
     # Apply max bet cap if specified
     if max_bet is not None:
         bet_size = min(bet_size, max_bet)
@@ -147,6 +155,78 @@ def calculate_bet_size(
     return round(bet_size, 2)
 
 
+# ------------------------------------------------------------
+# Vectorized (batch) versions - for scanning many candidate bets at once
+# ------------------------------------------------------------
+
+def american_to_decimal_vec(american_odds: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of American odds to decimal odds
+
+    Same result as american_to_decimal() element-wise
+    """
+    odds = np.asarray(american_odds, dtype=float)
+    # np.where evaluates both branches; 0 odds would warn in the unused 100/|odds| one
+    with np.errstate(divide="ignore"):
+        return np.where(odds > 0, odds / 100 + 1, 100 / np.abs(odds) + 1)
+
+
+def kelly_vec(
+    win_probability: np.ndarray,
+    decimal_odds: np.ndarray,
+    fraction: float = 1.0
+) -> np.ndarray:
+    """
+    Kelly Criterion over arrays of win probabilities and decimal odds
+
+    Same result as kelly_criterion() element-wise: 0 where there is no
+    edge or the inputs are out of range
+    """
+    p = np.asarray(win_probability, dtype=float)
+    dec = np.asarray(decimal_odds, dtype=float)
+
+    b = dec - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = (b * p - (1 - p)) / b
+
+    valid = (p > 0) & (p < 1) & (dec > 1) & (k > 0)
+    return np.where(valid, k * fraction, 0.0)
+
+
+def calculate_bet_sizes_batch(
+    bankrolls: np.ndarray,
+    american_odds: np.ndarray,
+    win_probabilities: np.ndarray,
+    kelly_fraction: float = 0.25,
+    max_bet: Optional[float] = None
+) -> np.ndarray:
+    """
+    Kelly bet sizes for a batch of candidate bets
+
+    Vectorized equivalent of calculate_bet_size(strategy_type="kelly", ...)
+
+    Args:
+        bankrolls: Current bankroll per bet ($), or a single bankroll
+        american_odds: The odds we're getting per bet
+        win_probabilities: Estimated win probability per bet (0-1)
+        kelly_fraction: Fraction of Kelly to use (default 0.25)
+        max_bet: Hard cap on bet size ($)
+
+    Returns:
+        Array of bet sizes in dollars
+    """
+    bankrolls = np.asarray(bankrolls, dtype=float)
+    decimal_odds = american_to_decimal_vec(american_odds)
+    bet_sizes = bankrolls * kelly_vec(win_probabilities, decimal_odds, kelly_fraction)
+
+    # Apply max bet cap if specified
+    if max_bet is not None:
+        bet_sizes = np.minimum(bet_sizes, max_bet)
+
+    # Never bet more than bankroll, rounded to cents
+    return np.minimum(bet_sizes, bankrolls).round(2)
+
+
 def calculate_to_win(stake: float, american_odds: int) -> float:
     """
     Calculate potential profit from a bet
@@ -221,7 +301,6 @@ def estimate_win_probability_from_edge(
 
     # Use normal distribution to estimate probability
     # Assuming prediction error follows normal distribution
-    from math import erf, sqrt
 
     # Z-score: how many standard deviations away
     z = edge / historical_std_dev
@@ -233,6 +312,39 @@ def estimate_win_probability_from_edge(
     return min(max(prob, 0.51), 0.75)
 
 
+def estimate_win_probabilities_from_edge(
+    predicted_values: np.ndarray,
+    line_values: np.ndarray,
+    picks: np.ndarray,
+    historical_std_dev: float = 5.0
+) -> np.ndarray:
+    """
+    Vectorized estimate_win_probability_from_edge() for a slate of picks
+
+    Args:
+        predicted_values: Our model's predictions
+        line_values: The betting lines
+        picks: "over" or "under" per prediction
+        historical_std_dev: Historical standard deviation of predictions
+
+    Returns:
+        Array of estimated win probabilities (0-1)
+    """
+    # scipy is slow to import and only this batch helper needs it
+    from scipy.special import ndtr
+
+    pred = np.asarray(predicted_values, dtype=float)
+    line = np.asarray(line_values, dtype=float)
+
+    # Flip the edge for "under" picks
+    sign = np.where(np.char.lower(np.asarray(picks, dtype=str)) == "under", -1.0, 1.0)
+    edge = sign * (pred - line)
+
+    # Normal CDF of the z-score, capped like the scalar version; no edge = coin flip
+    probs = np.clip(ndtr(edge / historical_std_dev), 0.51, 0.75)
+    return np.where(edge <= 0, 0.5, probs)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     print("🎲 TakeFreePoints Betting Utilities")